@@ -0,0 +1,12 @@
+-- Job table used by the async /jobs API (original layout).
+CREATE TABLE IF NOT EXISTS solver_jobs (
+    job_id       uuid PRIMARY KEY,
+    status       text NOT NULL,
+    created_at   timestamptz NOT NULL DEFAULT now(),
+    started_at   timestamptz,
+    finished_at  timestamptz,
+    error        text,
+    spec_json    jsonb,
+    params_json  jsonb,
+    result_json  jsonb
+);
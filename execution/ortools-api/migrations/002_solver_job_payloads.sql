@@ -0,0 +1,26 @@
+-- Move the large JSON documents out of solver_jobs so status polls only touch
+-- the small metadata row (no TOAST detoasting of spec/result).
+CREATE TABLE IF NOT EXISTS solver_job_payloads (
+    job_id       uuid PRIMARY KEY REFERENCES solver_jobs (job_id) ON DELETE CASCADE,
+    spec_json    jsonb NOT NULL,
+    result_json  jsonb
+);
+
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'solver_jobs' AND column_name = 'spec_json'
+    ) THEN
+        INSERT INTO solver_job_payloads (job_id, spec_json, result_json)
+        SELECT job_id, COALESCE(spec_json, '{}'::jsonb), result_json
+        FROM solver_jobs
+        ON CONFLICT (job_id) DO NOTHING;
+
+        ALTER TABLE solver_jobs DROP COLUMN spec_json, DROP COLUMN result_json;
+    END IF;
+END $$;
+
+-- Serves containment lookups on spec contents: spec_json @> '{"sets": {...}}'
+CREATE INDEX IF NOT EXISTS solver_jobs_spec_gin
+    ON solver_job_payloads USING gin (spec_json jsonb_path_ops);
@@ -0,0 +1,7 @@
+-- Spec/result documents are large and repetitive; lz4 TOAST compression
+-- (PostgreSQL 14+) compresses and decompresses them faster than the default
+-- pglz. Applies to values written from now on; the columns stay jsonb, so
+-- containment lookups and solver_jobs_spec_gin are unaffected.
+ALTER TABLE solver_job_payloads
+    ALTER COLUMN spec_json SET COMPRESSION lz4,
+    ALTER COLUMN result_json SET COMPRESSION lz4;